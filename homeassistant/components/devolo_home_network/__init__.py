@@ -1,7 +1,9 @@
 """The devolo Home Network integration."""
 from __future__ import annotations
 
+from dataclasses import dataclass
 import logging
+from operator import attrgetter
 from typing import Any
 
 import async_timeout
@@ -31,6 +33,14 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class PlcNetworkSummary:
+    """PLC network overview together with values derived from it per update."""
+
+    network: LogicalNetwork
+    connected_devices: int
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up devolo Home Network from a config entry."""
     hass.data.setdefault(DOMAIN, {})
@@ -50,14 +60,20 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             f"Unable to connect to {entry.data[CONF_IP_ADDRESS]}"
         ) from err
 
-    async def async_update_connected_plc_devices() -> LogicalNetwork:
+    async def async_update_connected_plc_devices() -> PlcNetworkSummary:
         """Fetch data from API endpoint."""
         assert device.plcnet
         try:
             async with async_timeout.timeout(10):
-                return await device.plcnet.async_get_network_overview()
+                network = await device.plcnet.async_get_network_overview()
         except DeviceUnavailable as err:
             raise UpdateFailed(err) from err
+        return PlcNetworkSummary(
+            network=network,
+            connected_devices=len(
+                set(map(attrgetter("mac_address_from"), network.data_rates))
+            ),
+        )
 
     async def async_update_wifi_connected_station() -> list[ConnectedStationInfo]:
         """Fetch data from API endpoint."""
@@ -87,6 +103,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             hass,
             _LOGGER,
             name=CONNECTED_PLC_DEVICES,
+            always_update=False,
             update_method=async_update_connected_plc_devices,
             update_interval=LONG_UPDATE_INTERVAL,
         )
@@ -95,6 +112,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             hass,
             _LOGGER,
             name=CONNECTED_WIFI_CLIENTS,
+            always_update=False,
             update_method=async_update_wifi_connected_station,
             update_interval=SHORT_UPDATE_INTERVAL,
         )
@@ -102,6 +120,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             hass,
             _LOGGER,
             name=NEIGHBORING_WIFI_NETWORKS,
+            always_update=False,
             update_method=async_update_wifi_neighbor_access_points,
             update_interval=LONG_UPDATE_INTERVAL,
         )
@@ -6,7 +6,6 @@ from dataclasses import dataclass
 from typing import Any
 
 from devolo_plc_api import Device
-from devolo_plc_api.plcnet_api import LogicalNetwork
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -19,6 +18,7 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from . import PlcNetworkSummary
 from .const import CONNECTED_PLC_DEVICES, CONNECTED_TO_ROUTER, DOMAIN
 from .entity import DevoloEntity
 
@@ -27,7 +27,7 @@ def _is_connected_to_router(entity: DevoloBinarySensorEntity) -> bool:
     """Check, if device is attached to the router."""
     return all(
         device.attached_to_router
-        for device in entity.coordinator.data.devices
+        for device in entity.coordinator.data.network.devices
         if device.mac_address == entity.device.mac
     )
 
@@ -81,12 +81,12 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class DevoloBinarySensorEntity(DevoloEntity[LogicalNetwork], BinarySensorEntity):
+class DevoloBinarySensorEntity(DevoloEntity[PlcNetworkSummary], BinarySensorEntity):
     """Representation of a devolo binary sensor."""
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator[LogicalNetwork],
+        coordinator: DataUpdateCoordinator[PlcNetworkSummary],
         description: DevoloBinarySensorEntityDescription,
         device: Device,
         device_name: str,
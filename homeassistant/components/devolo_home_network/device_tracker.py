@@ -77,6 +77,7 @@ async def async_setup_entry(
 
     if device.device and "wifi1" in device.device.features:
         restore_entities()
+        new_device_callback()
         entry.async_on_unload(
             coordinators[CONNECTED_WIFI_CLIENTS].async_add_listener(new_device_callback)
         )
@@ -5,7 +5,6 @@ from typing import TypeVar, Union
 
 from devolo_plc_api.device import Device
 from devolo_plc_api.device_api import ConnectedStationInfo, NeighborAPInfo
-from devolo_plc_api.plcnet_api import LogicalNetwork
 
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import (
@@ -13,12 +12,13 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
+from . import PlcNetworkSummary
 from .const import DOMAIN
 
 _DataT = TypeVar(
     "_DataT",
     bound=Union[
-        LogicalNetwork,
+        PlcNetworkSummary,
         list[ConnectedStationInfo],
         list[NeighborAPInfo],
     ],
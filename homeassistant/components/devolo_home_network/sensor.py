@@ -7,7 +7,6 @@ from typing import Any, Generic, TypeVar, Union
 
 from devolo_plc_api.device import Device
 from devolo_plc_api.device_api import ConnectedStationInfo, NeighborAPInfo
-from devolo_plc_api.plcnet_api import LogicalNetwork
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -20,6 +19,7 @@ from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from . import PlcNetworkSummary
 from .const import (
     CONNECTED_PLC_DEVICES,
     CONNECTED_WIFI_CLIENTS,
@@ -31,13 +31,18 @@ from .entity import DevoloEntity
 _DataT = TypeVar(
     "_DataT",
     bound=Union[
-        LogicalNetwork,
+        PlcNetworkSummary,
         list[ConnectedStationInfo],
         list[NeighborAPInfo],
     ],
 )
 
 
+def _connected_plc_devices(data: PlcNetworkSummary) -> int:
+    """Get the number of connected PLC devices."""
+    return data.connected_devices
+
+
 @dataclass
 class DevoloSensorRequiredKeysMixin(Generic[_DataT]):
     """Mixin for required keys."""
@@ -53,17 +58,15 @@ class DevoloSensorEntityDescription(
 
 
 SENSOR_TYPES: dict[str, DevoloSensorEntityDescription[Any]] = {
-    CONNECTED_PLC_DEVICES: DevoloSensorEntityDescription[LogicalNetwork](
+    CONNECTED_PLC_DEVICES: DevoloSensorEntityDescription(
         key=CONNECTED_PLC_DEVICES,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
         icon="mdi:lan",
         name="Connected PLC devices",
-        value_func=lambda data: len(
-            {device.mac_address_from for device in data.data_rates}
-        ),
+        value_func=_connected_plc_devices,
     ),
-    CONNECTED_WIFI_CLIENTS: DevoloSensorEntityDescription[list[ConnectedStationInfo]](
+    CONNECTED_WIFI_CLIENTS: DevoloSensorEntityDescription(
         key=CONNECTED_WIFI_CLIENTS,
         entity_registry_enabled_default=True,
         icon="mdi:wifi",
@@ -71,7 +74,7 @@ SENSOR_TYPES: dict[str, DevoloSensorEntityDescription[Any]] = {
         state_class=SensorStateClass.MEASUREMENT,
         value_func=len,
     ),
-    NEIGHBORING_WIFI_NETWORKS: DevoloSensorEntityDescription[list[NeighborAPInfo]](
+    NEIGHBORING_WIFI_NETWORKS: DevoloSensorEntityDescription(
         key=NEIGHBORING_WIFI_NETWORKS,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
@@ -1,11 +1,14 @@
 """The Washer/Dryer Sensor for Whirlpool Appliances."""
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from itertools import chain
 import logging
 
+import aiohttp
 from whirlpool.washerdryer import MachineState, WasherDryer
 
 from homeassistant.components.sensor import (
@@ -20,6 +23,10 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
+from homeassistant.helpers.update_coordinator import (
+    CoordinatorEntity,
+    DataUpdateCoordinator,
+)
 from homeassistant.util.dt import utcnow
 
 from . import WhirlpoolData
@@ -56,14 +63,24 @@ MACHINE_STATE = {
     MachineState.SystemInit: "System Initialize",
 }
 
-CYCLE_FUNC = [
+# The machine state values are contiguous from 0, so the names can be looked
+# up by value without hashing the enum members.
+MACHINE_STATE_NAMES = tuple(
+    MACHINE_STATE[machine_state] for machine_state in MachineState
+)
+
+# Looking up enum members on the class is slow, keep the hot ones at hand.
+RUNNING_MAIN_CYCLE = MachineState.RunningMainCycle
+TERMINAL_MACHINE_STATES = frozenset({MachineState.Complete, MachineState.Standby})
+
+CYCLE_FUNC = (
     (WasherDryer.get_cycle_status_filling, "Cycle Filling"),
     (WasherDryer.get_cycle_status_rinsing, "Cycle Rinsing"),
     (WasherDryer.get_cycle_status_sensing, "Cycle Sensing"),
     (WasherDryer.get_cycle_status_soaking, "Cycle Soaking"),
     (WasherDryer.get_cycle_status_spinning, "Cycle Spinning"),
     (WasherDryer.get_cycle_status_washing, "Cycle Washing"),
-]
+)
 
 
 ICON_D = "mdi:tumble-dryer"
@@ -80,19 +97,73 @@ def washer_state(washer: WasherDryer) -> str | None:
 
     machine_state = washer.get_machine_state()
 
-    if machine_state == MachineState.RunningMainCycle:
+    if machine_state is RUNNING_MAIN_CYCLE:
         for func, cycle_name in CYCLE_FUNC:
             if func(washer):
                 return cycle_name
 
-    return MACHINE_STATE.get(machine_state, STATE_UNKNOWN)
+    if machine_state is None:
+        return STATE_UNKNOWN
+
+    return MACHINE_STATE_NAMES[machine_state.value]
+
+
+@dataclass(frozen=True)
+class WasherDryerData:
+    """Attributes of a washer/dryer shared by its sensors.
+
+    The remaining time in seconds is only set while running the main cycle.
+    """
+
+    online: bool
+    machine_state: MachineState | None
+    state: str | None
+    detergent_level: str | None
+    time_remaining: int | None
+
+
+class WasherDryerCoordinator(DataUpdateCoordinator[WasherDryerData]):
+    """Decode the attributes pushed by a washer/dryer once for all its sensors."""
+
+    def __init__(self, hass: HomeAssistant, said: str, washdry: WasherDryer) -> None:
+        """Initialize the washer/dryer coordinator."""
+        super().__init__(hass, _LOGGER, name=said, always_update=False)
+        self.washdry = washdry
+
+    def _get_data(self) -> WasherDryerData:
+        """Read the latest attributes of the washer/dryer."""
+        washdry = self.washdry
+        machine_state = washdry.get_machine_state()
+        return WasherDryerData(
+            online=washdry.get_online(),
+            machine_state=machine_state,
+            state=washer_state(washdry),
+            detergent_level=TANK_FILL.get(
+                washdry.get_attribute("WashCavity_OpStatusBulkDispense1Level")
+            ),
+            time_remaining=int(
+                washdry.get_attribute("Cavity_TimeStatusEstTimeRemaining")
+            )
+            if machine_state is RUNNING_MAIN_CYCLE
+            else None,
+        )
+
+    async def _async_update_data(self) -> WasherDryerData:
+        """Fetch the latest data of the washer/dryer."""
+        return self._get_data()
+
+    @callback
+    def async_handle_attr_update(self) -> None:
+        """Notify the sensors if an attribute push changed their data."""
+        if (data := self._get_data()) != self.data:
+            self.async_set_updated_data(data)
 
 
 @dataclass
 class WhirlpoolSensorEntityDescriptionMixin:
     """Mixin for required keys."""
 
-    value_fn: Callable
+    value_fn: Callable[[WasherDryerData], StateType]
 
 
 @dataclass
@@ -108,16 +179,14 @@ SENSORS: tuple[WhirlpoolSensorEntityDescription, ...] = (
         name="State",
         icon=ICON_W,
         has_entity_name=True,
-        value_fn=washer_state,
+        value_fn=lambda data: data.state,
     ),
     WhirlpoolSensorEntityDescription(
         key="DispenseLevel",
         name="Detergent Level",
         icon=ICON_W,
         has_entity_name=True,
-        value_fn=lambda WasherDryer: TANK_FILL[
-            WasherDryer.get_attribute("WashCavity_OpStatusBulkDispense1Level")
-        ],
+        value_fn=lambda data: data.detergent_level,
     ),
 )
 
@@ -138,71 +207,79 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Config flow entry for Whrilpool Laundry."""
-    entities: list = []
+    entities: list[SensorEntity] = []
     whirlpool_data: WhirlpoolData = hass.data[DOMAIN][config_entry.entry_id]
-    for appliance in whirlpool_data.appliances_manager.washer_dryers:
-        _wd = WasherDryer(
-            whirlpool_data.backend_selector,
-            whirlpool_data.auth,
+    washer_dryers = [
+        (
             appliance["SAID"],
+            appliance["NAME"],
+            WasherDryer(
+                whirlpool_data.backend_selector,
+                whirlpool_data.auth,
+                appliance["SAID"],
+            ),
         )
-        await _wd.connect()
-
-        entities.extend(
-            [
-                WasherDryerClass(
-                    appliance["SAID"],
-                    appliance["NAME"],
-                    description,
-                    _wd,
-                )
-                for description in SENSORS
-            ]
+        for appliance in whirlpool_data.appliances_manager.washer_dryers
+    ]
+    results = await asyncio.gather(
+        *(_wd.connect() for _, _, _wd in washer_dryers), return_exceptions=True
+    )
+    for (said, name, _wd), result in zip(washer_dryers, results):
+        if isinstance(result, (aiohttp.ClientError, asyncio.TimeoutError)):
+            _LOGGER.error("Cannot connect to %s: %s", name, result)
+            continue
+        if isinstance(result, BaseException):
+            raise result
+
+        coordinator = WasherDryerCoordinator(hass, said, _wd)
+        await coordinator.async_refresh()
+        _wd.register_attr_callback(coordinator.async_handle_attr_update)
+
+        display_name = name.capitalize()
+        icon = ICON_D if display_name == "Dryer" else ICON_W
+        device_info = DeviceInfo(
+            identifiers={(DOMAIN, said)},
+            name=display_name,
+            manufacturer="Whirlpool",
         )
         entities.extend(
-            [
-                WasherDryerTimeClass(
-                    appliance["SAID"],
-                    appliance["NAME"],
-                    description,
-                    _wd,
-                )
-                for description in SENSOR_TIMER
-            ]
+            chain(
+                (
+                    WasherDryerClass(said, description, coordinator, device_info, icon)
+                    for description in SENSORS
+                ),
+                (
+                    WasherDryerTimeClass(
+                        said, description, coordinator, device_info, icon
+                    )
+                    for description in SENSOR_TIMER
+                ),
+            )
         )
     async_add_entities(entities)
 
 
-class WasherDryerClass(SensorEntity):
+class WasherDryerClass(CoordinatorEntity[WasherDryerCoordinator], SensorEntity):
     """A class for the whirlpool/maytag washer account."""
 
-    _attr_should_poll = False
+    __slots__ = ("_wd", "_value_fn")
 
     def __init__(
         self,
         said: str,
-        name: str,
         description: WhirlpoolSensorEntityDescription,
-        washdry: WasherDryer,
+        coordinator: WasherDryerCoordinator,
+        device_info: DeviceInfo,
+        icon: str,
     ) -> None:
         """Initialize the washer sensor."""
-        self._name = name.capitalize()
-        self._wd: WasherDryer = washdry
-
-        if self._name == "Dryer":
-            self._attr_icon = ICON_D
-
+        super().__init__(coordinator)
+        self._wd: WasherDryer = coordinator.washdry
+        self._attr_icon = icon
         self.entity_description: WhirlpoolSensorEntityDescription = description
+        self._value_fn = description.value_fn
         self._attr_unique_id = f"{said}-{description.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, said)},
-            name=self._name,
-            manufacturer="Whirlpool",
-        )
-
-    async def async_added_to_hass(self) -> None:
-        """Connect washer/dryer to the cloud."""
-        self._wd.register_attr_callback(self.async_write_ha_state)
+        self._attr_device_info = device_info
 
     async def async_will_remove_from_hass(self) -> None:
         """Close Whrilpool Appliance sockets before removing."""
@@ -211,49 +288,50 @@ class WasherDryerClass(SensorEntity):
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self._wd.get_online()
+        return super().available and self.coordinator.data.online
 
     @property
     def native_value(self) -> StateType | str:
         """Return native value of sensor."""
-        return self.entity_description.value_fn(self._wd)
+        return self._value_fn(self.coordinator.data)
 
 
-class WasherDryerTimeClass(RestoreSensor):
+class WasherDryerTimeClass(CoordinatorEntity[WasherDryerCoordinator], RestoreSensor):
     """A timestamp class for the whirlpool/maytag washer account."""
 
-    _attr_should_poll = False
+    __slots__ = (
+        "_wd",
+        "_running",
+        "_last_machine_state",
+        "_last_remaining",
+        "_timestamp",
+    )
 
     def __init__(
         self,
         said: str,
-        name: str,
         description: SensorEntityDescription,
-        washdry: WasherDryer,
+        coordinator: WasherDryerCoordinator,
+        device_info: DeviceInfo,
+        icon: str,
     ) -> None:
         """Initialize the washer sensor."""
-        self._name = name.capitalize()
-        self._wd: WasherDryer = washdry
-
-        if self._name == "Dryer":
-            self._attr_icon = ICON_D
-
+        super().__init__(coordinator)
+        self._wd: WasherDryer = coordinator.washdry
+        self._attr_icon = icon
         self.entity_description: SensorEntityDescription = description
         self._attr_unique_id = f"{said}-{description.key}"
         self._running: bool | None = None
+        self._last_machine_state: MachineState | None = None
+        self._last_remaining: int | None = None
         self._timestamp: datetime | None = None
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, said)},
-            name=self._name,
-            manufacturer="Whirlpool",
-        )
+        self._attr_device_info = device_info
 
     async def async_added_to_hass(self) -> None:
         """Connect washer/dryer to the cloud."""
         if restored_data := await self.async_get_last_sensor_data():
             self._attr_native_value = restored_data.native_value
         await super().async_added_to_hass()
-        self._wd.register_attr_callback(self.update_from_latest_data)
 
     async def async_will_remove_from_hass(self) -> None:
         """Close Whrilpool Appliance sockets before removing."""
@@ -262,26 +340,29 @@ class WasherDryerTimeClass(RestoreSensor):
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self._wd.get_online()
+        return super().available and self.coordinator.data.online
 
     @callback
-    def update_from_latest_data(self) -> None:
+    def _handle_coordinator_update(self) -> None:
         """Calculate the time stamp for completion."""
-        machine_state = self._wd.get_machine_state()
-        now = utcnow()
+        data = self.coordinator.data
+        machine_state = data.machine_state
+        time_remaining = data.time_remaining
         if (
-            machine_state.value
-            in {MachineState.Complete.value, MachineState.Standby.value}
-            and self._running
+            machine_state is self._last_machine_state
+            and time_remaining == self._last_remaining
         ):
-            self._running = False
-            self._attr_native_value = now
-            self._async_write_ha_state()
+            return
 
-        if machine_state is MachineState.RunningMainCycle:
-            self._running = True
-            self._attr_native_value = now + timedelta(
-                seconds=int(self._wd.get_attribute("Cavity_TimeStatusEstTimeRemaining"))
-            )
+        self._last_machine_state = machine_state
+        self._last_remaining = time_remaining
+        if time_remaining is None:
+            if machine_state in TERMINAL_MACHINE_STATES and self._running:
+                self._running = False
+                self._attr_native_value = utcnow()
+                self._async_write_ha_state()
 
+        else:
+            self._running = True
+            self._attr_native_value = utcnow() + timedelta(seconds=time_remaining)
             self._async_write_ha_state()
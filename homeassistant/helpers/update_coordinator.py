@@ -64,6 +64,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_T]):
         update_interval: timedelta | None = None,
         update_method: Callable[[], Awaitable[_T]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
+        always_update: bool = True,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -71,6 +72,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_T]):
         self.name = name
         self.update_method = update_method
         self.update_interval = update_interval
+        # If always_update is False, listeners are only notified when the
+        # fetched data differs from the previous data (compared with __eq__)
+        # or when the availability of the data changed.
+        self.always_update = always_update
         self.config_entry = config_entries.current_entry.get()
 
         # It's None before the first successful update.
@@ -234,6 +239,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_T]):
         if log_timing := self.logger.isEnabledFor(logging.DEBUG):
             start = monotonic()
         auth_failed = False
+        previous_update_success = self.last_update_success
+        previous_data = self.data
 
         try:
             self.data = await self._async_update_data()
@@ -327,7 +334,12 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_T]):
             if not auth_failed and self._listeners and not self.hass.is_stopping:
                 self._schedule_refresh()
 
-        self.async_update_listeners()
+        if (
+            self.always_update
+            or self.last_update_success != previous_update_success
+            or previous_data != self.data
+        ):
+            self.async_update_listeners()
 
     @callback
     def async_set_update_error(self, err: Exception) -> None:
@@ -1,9 +1,12 @@
 """Test the Whirlpool Sensor domain."""
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock
 
+import aiohttp
+from freezegun.api import FrozenDateTimeFactory
 from whirlpool.washerdryer import MachineState
 
+from homeassistant.const import ATTR_ICON, STATE_UNKNOWN
 from homeassistant.core import CoreState, HomeAssistant, State
 from homeassistant.helpers import entity_registry
 
@@ -55,12 +58,14 @@ async def test_dryer_sensor_values(
     state = hass.states.get(entity_id)
     assert state is not None
     assert state.state == "Standby"
+    assert state.attributes[ATTR_ICON] == "mdi:tumble-dryer"
 
     state = await update_sensor_state(hass, entity_id, mock_instance)
     assert state is not None
     state_id = f"{entity_id.split('_')[0]}_end_time"
     state = hass.states.get(state_id)
     assert state is not None
+    assert state.attributes[ATTR_ICON] == "mdi:tumble-dryer"
 
     mock_instance.get_machine_state.return_value = MachineState.RunningMainCycle
     mock_instance.get_cycle_status_filling.return_value = False
@@ -243,3 +248,90 @@ async def test_restore_state(
     assert state.state == thetimestamp.isoformat()
     state = hass.states.get("sensor.dryer_end_time")
     assert state.state == thetimestamp.isoformat()
+
+
+async def test_unchanged_attributes(
+    hass: HomeAssistant,
+    mock_sensor_api_instances: MagicMock,
+    mock_sensor1_api: MagicMock,
+):
+    """Test attribute pushes without changes do not update the sensors."""
+    await init_integration(hass)
+
+    entity_id = "sensor.washer_state"
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state == "Standby"
+
+    # One callback is shared by all sensors of an appliance
+    assert mock_sensor1_api.register_attr_callback.call_count == 1
+
+    updated_state = await update_sensor_state(hass, entity_id, mock_sensor1_api)
+    assert updated_state is not None
+    assert updated_state.last_updated == state.last_updated
+
+    mock_sensor1_api.get_machine_state.return_value = MachineState.Pause
+    updated_state = await update_sensor_state(hass, entity_id, mock_sensor1_api)
+    assert updated_state is not None
+    assert updated_state.state == "Pause"
+    assert updated_state.last_updated != state.last_updated
+
+
+async def test_connect_failure(
+    hass: HomeAssistant,
+    mock_sensor_api_instances: MagicMock,
+    mock_sensor1_api: MagicMock,
+):
+    """Test a failing appliance does not prevent setting up the others."""
+    mock_sensor1_api.connect.side_effect = aiohttp.ClientError
+    await init_integration(hass)
+
+    assert hass.states.get("sensor.washer_state") is None
+    state = hass.states.get("sensor.dryer_state")
+    assert state is not None
+    assert state.state == "Standby"
+
+
+async def test_end_time(
+    hass: HomeAssistant,
+    mock_sensor_api_instances: MagicMock,
+    mock_sensor1_api: MagicMock,
+    freezer: FrozenDateTimeFactory,
+):
+    """Test the end time follows the remaining time of the main cycle."""
+    now = datetime(2022, 11, 29, 12, 0, 0, tzinfo=timezone.utc)
+    freezer.move_to(now)
+    await init_integration(hass)
+
+    entity_id = "sensor.washer_end_time"
+    state = hass.states.get(entity_id)
+    assert state is not None
+    assert state.state == STATE_UNKNOWN
+
+    mock_sensor1_api.get_machine_state.return_value = MachineState.RunningMainCycle
+    state = await update_sensor_state(hass, entity_id, mock_sensor1_api)
+    assert state is not None
+    assert state.state == (now + timedelta(seconds=3540)).isoformat()
+
+    # The end time is kept while the remaining time does not change
+    freezer.tick(timedelta(seconds=5))
+    mock_sensor1_api.get_cycle_status_filling.return_value = True
+    state = await update_sensor_state(hass, entity_id, mock_sensor1_api)
+    assert state is not None
+    assert state.state == (now + timedelta(seconds=3540)).isoformat()
+    assert hass.states.get("sensor.washer_state").state == "Cycle Filling"
+
+    # Resuming a paused cycle moves the end time by the pause
+    mock_sensor1_api.get_machine_state.return_value = MachineState.Pause
+    await update_sensor_state(hass, entity_id, mock_sensor1_api)
+    freezer.tick(timedelta(minutes=1))
+    mock_sensor1_api.get_machine_state.return_value = MachineState.RunningMainCycle
+    state = await update_sensor_state(hass, entity_id, mock_sensor1_api)
+    assert state is not None
+    assert state.state == (now + timedelta(seconds=3605)).isoformat()
+
+    freezer.tick(timedelta(minutes=10))
+    mock_sensor1_api.get_machine_state.return_value = MachineState.Complete
+    state = await update_sensor_state(hass, entity_id, mock_sensor1_api)
+    assert state is not None
+    assert state.state == (now + timedelta(minutes=11, seconds=5)).isoformat()
@@ -110,6 +110,49 @@ async def test_async_refresh(crd):
     assert updates == [2]
 
 
+async def test_async_refresh_no_always_update(hass):
+    """Test listeners are only called on changes if always_update is False."""
+    data = 1
+
+    async def refresh() -> int:
+        return data
+
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=refresh,
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+        always_update=False,
+    )
+    updates = []
+
+    def update_callback():
+        updates.append(crd.data)
+
+    crd.async_add_listener(update_callback)
+    await crd.async_refresh()
+    assert updates == [1]
+
+    await crd.async_refresh()
+    assert updates == [1]
+
+    data = 2
+    await crd.async_refresh()
+    assert updates == [1, 2]
+
+    # A failed update is always propagated, as is the recovery
+    crd.update_method = AsyncMock(side_effect=update_coordinator.UpdateFailed)
+    await crd.async_refresh()
+    assert crd.last_update_success is False
+    assert updates == [1, 2, 2]
+
+    crd.update_method = refresh
+    await crd.async_refresh()
+    assert crd.last_update_success is True
+    assert updates == [1, 2, 2, 2]
+
+
 async def test_update_context(crd: update_coordinator.DataUpdateCoordinator[int]):
     """Test update contexts for the update coordinator."""
     await crd.async_refresh()